@@ -113,8 +113,7 @@ class Predictor(Resource):
             original_name = name
             name = name + '_retrained'
 
-        model_names = [x['name'] for x in request.model_interface.get_models()]
-        if name in model_names:
+        if request.model_interface.has_model(name):
             return http_error(
                 409,
                 f"Predictor '{name}' already exists",
@@ -160,8 +159,7 @@ class PredictorAdjust(Resource):
         if from_data is None:
             return {'message': f'Can not find datasource: {ds_name}'}, 400
 
-        model_names = [x['name'] for x in request.model_interface.get_models()]
-        if name not in model_names:
+        if not request.model_interface.has_model(name):
             return abort(404, f'Predictor "{name}" doesn\'t exist',)
 
         request.model_interface.adjust(
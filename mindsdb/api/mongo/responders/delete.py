@@ -34,11 +34,8 @@ class Responce(Responder):
 
         predictor_name = query['deletes'][0]['q']['name']
 
-        models = mindsdb_env['mindsdb_native'].get_models()
-        model_names = [x['name'] for x in models]
-
         n = 0
-        if predictor_name in model_names:
+        if mindsdb_env['mindsdb_native'].has_model(predictor_name):
             n = 1
             mindsdb_env['mindsdb_native'].delete_model(predictor_name)
 
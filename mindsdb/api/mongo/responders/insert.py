@@ -36,7 +36,7 @@ class Responce(Responder):
             'connection'
         ]
 
-        models = mindsdb_env['mindsdb_native'].get_models()
+        model_interface = mindsdb_env['mindsdb_native']
 
         if len(query['documents']) != 1:
             raise Exception("Must be inserted just one predictor at time")
@@ -55,7 +55,7 @@ class Responce(Responder):
             if 'predict' not in doc:
                 raise Exception("Please, specify 'predict' field")
 
-            if doc['name'] in [x['name'] for x in models]:
+            if model_interface.has_model(doc['name']):
                 raise Exception(f"Predictor with name '{doc['name']}' already exists")
 
             select_data_query = doc.get('select_data_query')
@@ -16,7 +16,6 @@ import time
 
 import duckdb
 from lightwood.api import dtype
-from mindsdb_sql import parse_sql
 from mindsdb_sql.planner import plan_query
 from mindsdb_sql.parser.dialects.mindsdb.latest import Latest
 from mindsdb_sql.parser.ast import (
@@ -56,7 +55,7 @@ from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import TYPES, ERR
 from mindsdb.api.mysql.mysql_proxy.utilities import log
 from mindsdb.interfaces.ai_table.ai_table import AITableStore
 import mindsdb.interfaces.storage.db as db
-from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df
+from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df, parse_sql_cached
 from mindsdb.api.mysql.mysql_proxy.utilities.functions import get_column_in_case
 
 from mindsdb.api.mysql.mysql_proxy.utilities import (
@@ -217,7 +216,7 @@ class SQLQuery():
                     self.outer_query = sql.replace(subquery, 'dataframe')
                     sql = subquery.strip('()')
             # ---
-            self.query = parse_sql(sql, dialect='mindsdb')
+            self.query = parse_sql_cached(sql, dialect='mindsdb')
             self.query_str = sql
         else:
             self.query = sql
@@ -9,11 +9,6 @@ import numpy as np
 from mindsdb.api.mysql.mysql_proxy.datahub.datanodes.datanode import DataNode
 from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df
 from mindsdb.api.mysql.mysql_proxy.utilities.functions import get_column_in_case
-from mindsdb.integrations.clickhouse.clickhouse import Clickhouse
-from mindsdb.integrations.postgres.postgres import PostgreSQL
-from mindsdb.integrations.mariadb.mariadb import Mariadb
-from mindsdb.integrations.mysql.mysql import MySQL
-from mindsdb.integrations.mssql.mssql import MSSQL
 from mindsdb.utilities.functions import cast_row_types
 from mindsdb.utilities.config import Config
 
@@ -100,7 +95,7 @@ class MindsDBDataNode(DataNode):
         ai_tables = self.ai_table.get_ai_table(table)
         if ai_tables is not None:
             columns = self._get_ai_table_columns(table)
-        elif table in [x['name'] for x in self.model_interface.get_models()]:
+        elif self.model_interface.has_model(table):
             columns = self._get_model_columns(table)
             columns += ['when_data', 'select_data_query']
 
@@ -217,19 +212,24 @@ class MindsDBDataNode(DataNode):
 
             integration_data = self.datasource_interface.get_db_integration(integration_name)
             if integration_type == 'clickhouse':
+                from mindsdb.integrations.clickhouse.clickhouse import Clickhouse
                 ch = Clickhouse(self.config, integration_name, integration_data)
                 res = ch._query(select_data_query.strip(' ;\n') + ' FORMAT JSON')
                 data = res.json()['data']
             elif integration_type == 'mariadb':
+                from mindsdb.integrations.mariadb.mariadb import Mariadb
                 maria = Mariadb(self.config, integration_name, integration_data)
                 data = maria._query(select_data_query)
             elif integration_type == 'mysql':
+                from mindsdb.integrations.mysql.mysql import MySQL
                 mysql = MySQL(self.config, integration_name, integration_data)
                 data = mysql._query(select_data_query)
             elif integration_type == 'postgres':
+                from mindsdb.integrations.postgres.postgres import PostgreSQL
                 mysql = PostgreSQL(self.config, integration_name, integration_data)
                 data = mysql._query(select_data_query)
             elif integration_type == 'mssql':
+                from mindsdb.integrations.mssql.mssql import MSSQL
                 mssql = MSSQL(self.config, integration_name, integration_data)
                 data = mssql._query(select_data_query, fetch=True)
             else:
@@ -58,7 +58,7 @@ from mindsdb_sql.parser.dialects.mindsdb import (
     CreateView
 )
 
-from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df
+from mindsdb.api.mysql.mysql_proxy.utilities.sql import query_df, parse_sql_cached
 from mindsdb.utilities.wizards import make_ssl_cert
 from mindsdb.utilities.config import Config
 from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packet import Packet
@@ -367,8 +367,7 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             ).send()
             return
 
-        models = model_interface.get_models()
-        if insert['name'] in [x['name'] for x in models]:
+        if model_interface.has_model(insert['name']):
             self.packet(
                 ErrPacket,
                 err_code=ERR.ER_WRONG_ARGUMENTS,
@@ -433,9 +432,7 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             raise ErTableExistError(f"AT Table with name {struct['ai_table_name']} already exists")
 
         # check predictor exists
-        models = model_interface.get_models()
-        models_names = [x['name'] for x in models]
-        if struct['predictor_name'] not in models_names:
+        if not model_interface.has_model(struct['predictor_name']):
             raise ErBadTableError(f"Predictor with name {struct['predictor_name']} not exists")
 
         # check integration exists
@@ -528,8 +525,7 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         else:
             predictor_name = predictor_value
         model_interface = self.session.model_interface
-        models = model_interface.get_models()
-        if predictor_name not in [x['name'] for x in models]:
+        if not model_interface.has_model(predictor_name):
             raise ErBadTableError(f"Can't describe predictor. There is no predictor with name '{predictor_name}'")
         description = model_interface.get_model_description(predictor_name)
 
@@ -634,8 +630,7 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
 
     def answer_retrain_predictor(self, predictor_name):
         model_interface = self.session.model_interface
-        models = model_interface.get_models()
-        if predictor_name not in [x['name'] for x in models]:
+        if not model_interface.has_model(predictor_name):
             raise ErBadTableError(f"Can't retrain predictor. There is no predictor with name '{predictor_name}'")
         model_interface.update_model(predictor_name)
         self.packet(OkPacket).send()
@@ -787,7 +782,7 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         # fake_sql = sql.strip(' ')
         # fake_sql = 'select name ' + fake_sql[len('delete '):]
         sqlquery = SQLQuery(
-            query2.to_string(),
+            query2,
             session=self.session
         )
 
@@ -823,9 +818,10 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
                 ).send()
                 return
             predictor_name = command[2]
-            self.delete_predictor_query(parse_sql(
-                f"delete from mindsdb.predictors where name = '{predictor_name}'",
-                'mindsdb'
+            # name goes to the query as a constant, the query is passed as ast and is not parsed again
+            self.delete_predictor_query(Delete(
+                table=Identifier(parts=['mindsdb', 'predictors']),
+                where=BinaryOperation('=', args=[Identifier('name'), Constant(predictor_name)])
             ))
             self.packet(OkPacket).send()
             return
@@ -1270,6 +1266,67 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
         elif table_name == 'predictors':
             self.insert_predictor_answer(insert_dict)
 
+    def answer_create_datasource_statement(self, statement):
+        self.answer_create_datasource({
+            'datasource_name': statement.name,
+            'database_type': statement.engine,
+            'connection_args': statement.parameters
+        })
+
+    def answer_drop_predictor(self, statement):
+        predictor_name = statement.name.parts[-1]
+        self.session.datahub['mindsdb'].delete_predictor(predictor_name)
+        self.packet(OkPacket).send()
+
+    def answer_drop_datasource_statement(self, statement):
+        self.answer_drop_datasource(statement.name.parts[-1])
+
+    def answer_describe(self, statement):
+        if statement.value.parts[-1] in self.predictor_attrs:
+            self.answer_describe_predictor(statement.value.parts[-2:])
+        else:
+            self.answer_describe_predictor(statement.value.parts[-1])
+
+    def answer_retrain_predictor_statement(self, statement):
+        self.answer_retrain_predictor(statement.name.parts[-1])
+
+    def answer_transaction(self, statement):
+        self.packet(OkPacket).send()
+
+    def answer_use(self, statement):
+        db_name = statement.value.parts[-1]
+        self.change_default_db(db_name)
+        self.packet(OkPacket).send()
+
+    def answer_delete(self, statement):
+        if self.session.database != 'mindsdb' and statement.table.parts[0] != 'mindsdb':
+            raise ErBadTableError("Only 'DELETE' from database 'mindsdb' is possible at this moment")
+        if statement.table.parts[-1] != 'predictors':
+            raise ErBadTableError("Only 'DELETE' from table 'mindsdb.predictors' is possible at this moment")
+        self.delete_predictor_query(statement)
+        self.packet(OkPacket).send()
+
+    def answer_explain(self, statement):
+        self.answer_explain_table(statement.target.parts)
+
+    # statements which are answered the same way regardless of the raw sql text
+    statement_handlers = {
+        CreateDatasource: answer_create_datasource_statement,
+        DropPredictor: answer_drop_predictor,
+        DropDatasource: answer_drop_datasource_statement,
+        Describe: answer_describe,
+        RetrainPredictor: answer_retrain_predictor_statement,
+        StartTransaction: answer_transaction,
+        CommitTransaction: answer_transaction,
+        RollbackTransaction: answer_transaction,
+        Use: answer_use,
+        CreatePredictor: answer_create_predictor,
+        CreateView: answer_create_view,
+        Delete: answer_delete,
+        Insert: process_insert,
+        Explain: answer_explain
+    }
+
     def query_answer(self, sql):
         # +++
         # if query not for mindsdb then process that query in integration db
@@ -1326,43 +1383,23 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
 
         try:
             try:
-                statement = parse_sql(sql, dialect='mindsdb')
+                statement = parse_sql_cached(sql, dialect='mindsdb')
             except Exception:
-                statement = parse_sql(sql, dialect='mysql')
+                statement = parse_sql_cached(sql, dialect='mysql')
         except Exception:
             # not all statemts are parse by parse_sql
             log.warning(f'SQL statement are not parsed by mindsdb_sql: {sql}')
             pass
 
-        if type(statement) == CreateDatasource:
-            struct = {
-                'datasource_name': statement.name,
-                'database_type': statement.engine,
-                'connection_args': statement.parameters
-            }
-            self.answer_create_datasource(struct)
+        handler = self.statement_handlers.get(type(statement))
+        if handler is not None:
+            handler(self, statement)
             return
-        if type(statement) == DropPredictor:
-            predictor_name = statement.name.parts[-1]
-            self.session.datahub['mindsdb'].delete_predictor(predictor_name)
-            self.packet(OkPacket).send()
-        elif keyword == 'create_datasource':
+
+        if keyword == 'create_datasource':
             # fallback for statement
             self.answer_create_datasource(struct)
             return
-        elif type(statement) == DropDatasource:
-            ds_name = statement.name.parts[-1]
-            self.answer_drop_datasource(ds_name)
-            return
-        elif type(statement) == Describe:
-            if statement.value.parts[-1] in self.predictor_attrs:
-                self.answer_describe_predictor(statement.value.parts[-2:])
-            else:
-                self.answer_describe_predictor(statement.value.parts[-1])
-            return
-        elif type(statement) == RetrainPredictor:
-            self.answer_retrain_predictor(statement.name.parts[-1])
-            return
         elif type(statement) == Show:
             sql_category = statement.category.lower()
             if sql_category == 'predictors':
@@ -1677,8 +1714,6 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
                 return
             else:
                 raise ErNotSupportedYet(f'Statement not implemented: {sql}')
-        elif type(statement) in (StartTransaction, CommitTransaction, RollbackTransaction):
-            self.packet(OkPacket).send()
         elif type(statement) == Set:
             category = (statement.category or '').lower()
             if category == '' and type(statement.arg) == BinaryOperation:
@@ -1707,28 +1742,11 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             else:
                 log.warning(f'SQL statement is not processable, return OK package: {sql}')
                 self.packet(OkPacket).send()
-        elif type(statement) == Use:
-            db_name = statement.value.parts[-1]
-            self.change_default_db(db_name)
-            self.packet(OkPacket).send()
-        elif type(statement) == CreatePredictor:
-            self.answer_create_predictor(statement)
-        elif type(statement) == CreateView:
-            self.answer_create_view(statement)
         elif keyword == 'set':
             log.warning(f'Unknown SET query, return OK package: {sql}')
             self.packet(OkPacket).send()
         elif keyword == 'create_ai_table':
             self.answer_create_ai_table(struct)
-        elif type(statement) == Delete:
-            if self.session.database != 'mindsdb' and statement.table.parts[0] != 'mindsdb':
-                raise ErBadTableError("Only 'DELETE' from database 'mindsdb' is possible at this moment")
-            if statement.table.parts[-1] != 'predictors':
-                raise ErBadTableError("Only 'DELETE' from table 'mindsdb.predictors' is possible at this moment")
-            self.delete_predictor_query(statement)
-            self.packet(OkPacket).send()
-        elif type(statement) == Insert:
-            self.process_insert(statement)
         elif keyword in ('update', 'insert'):
             raise ErNotSupportedYet('Update and Insert are not implemented')
         elif keyword == 'alter' and ('disable keys' in sql_lower) or ('enable keys' in sql_lower):
@@ -1778,8 +1796,6 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
                 session=self.session
             )
             self.answer_select(query)
-        elif type(statement) == Explain:
-            self.answer_explain_table(statement.target.parts)
         else:
             log.warning(f'Unknown SQL statement: {sql}')
             raise ErNotSupportedYet(f'Unknown SQL statement: {sql}')
@@ -1,3 +1,6 @@
+from copy import deepcopy
+from functools import lru_cache
+
 import duckdb
 import numpy as np
 from mindsdb_sql import parse_sql
@@ -6,6 +9,29 @@ from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
 
 from mindsdb.utilities.log import log
 
+# longer queries are not cached, to keep memory used by the cache bounded
+MAX_CACHED_QUERY_LENGTH = 4096
+
+
+@lru_cache(maxsize=256)
+def _parse_sql_cached(sql, dialect):
+    return parse_sql(sql, dialect=dialect)
+
+
+def parse_sql_cached(sql, dialect='mysql'):
+    """ Same as mindsdb_sql.parse_sql, but reuses results for repeated queries.
+
+        Args:
+            sql (str): query
+            dialect (str): parser dialect
+
+        Returns:
+            mindsdb_sql.parser.ast.ASTNode: copy of the cached ast, it is safe to modify it
+    """
+    if len(sql) > MAX_CACHED_QUERY_LENGTH:
+        return parse_sql(sql, dialect=dialect)
+    return deepcopy(_parse_sql_cached(sql, dialect))
+
 
 def _remove_table_name(root):
     if isinstance(root, BinaryOperation):
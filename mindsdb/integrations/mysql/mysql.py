@@ -1,9 +1,69 @@
 from contextlib import closing
+from itertools import count
+from threading import Lock
 import mysql.connector
+import mysql.connector.pooling
 
 from lightwood.api import dtype
 from mindsdb.integrations.base import Integration
-from mindsdb.utilities.log import log
+import mindsdb.interfaces.storage.db as db
+
+# integration objects are short-lived, so pools are shared between them.
+# integration id -> (connection config, pool)
+_connection_pools = {}
+_connection_pools_lock = Lock()
+_pool_ids = count()
+
+_DEFAULT_TYPE = 'VARCHAR(500)'
+
+_SUBTYPE_MAP = {
+    dtype.integer: 'int',
+    dtype.float: 'double',
+    dtype.binary: 'VARCHAR(500)',
+    dtype.date: 'Date',
+    dtype.datetime: 'Datetime',
+    dtype.categorical: 'VARCHAR(500)',
+    dtype.tags: 'VARCHAR(500)',
+    dtype.image: 'VARCHAR(500)',
+    dtype.video: 'VARCHAR(500)',
+    dtype.audio: 'VARCHAR(500)',
+    dtype.short_text: 'VARCHAR(500)',
+    dtype.rich_text: 'VARCHAR(500)',
+    dtype.quantity: 'VARCHAR(500)',
+    dtype.num_array: 'VARCHAR(500)',
+    dtype.cat_array: 'VARCHAR(500)',
+    dtype.num_tsarray: 'VARCHAR(500)',
+    dtype.cat_tsarray: 'VARCHAR(500)'
+}
+
+
+class _ConnectionPool(mysql.connector.pooling.MySQLConnectionPool):
+    ''' pool which can be closed. Connections which are returned to closed pool are disconnected
+    '''
+    def __init__(self, **kwargs):
+        self._close_lock = Lock()
+        self._closed = False
+        super().__init__(**kwargs)
+
+    def add_connection(self, cnx=None):
+        with self._close_lock:
+            if self._closed is True and cnx is not None:
+                cnx.disconnect()
+                return
+            super().add_connection(cnx)
+
+    def close(self):
+        with self._close_lock:
+            self._closed = True
+            # NOTE _remove_connections is not public api, it is present in mysql-connector-python 8.x
+            self._remove_connections()
+
+
+def close_connection_pool(integration_id):
+    with _connection_pools_lock:
+        pool_record = _connection_pools.pop(integration_id, None)
+    if pool_record is not None:
+        pool_record[1].close()
 
 
 class MySQLConnectionChecker:
@@ -17,7 +77,7 @@ class MySQLConnectionChecker:
         self.ssl_cert = kwargs.get('ssl_cert')
         self.ssl_key = kwargs.get('ssl_key')
 
-    def _get_connnection(self):
+    def _get_connection_config(self):
         config = {
             "host": self.host,
             "port": self.port,
@@ -32,7 +92,10 @@ class MySQLConnectionChecker:
                 config["ssl_cert"] = self.ssl_cert
             if self.ssl_key is not None:
                 config["ssl_key"] = self.ssl_key
-        return mysql.connector.connect(**config)
+        return config
+
+    def _get_connnection(self):
+        return mysql.connector.connect(**self._get_connection_config())
 
     def check_connection(self):
         try:
@@ -55,60 +118,85 @@ class MySQL(Integration, MySQLConnectionChecker):
         self.ssl_ca = db_info.get('ssl_ca')
         self.ssl_cert = db_info.get('ssl_cert')
         self.ssl_key = db_info.get('ssl_key')
+        self.integration_id = db_info.get('id')
 
     def _to_mysql_table(self, dtype_dict, predicted_cols, columns):
-        subtype_map = {
-            dtype.integer: 'int',
-            dtype.float: 'double',
-            dtype.binary: 'bool',
-            dtype.date: 'Date',
-            dtype.datetime: 'Datetime',
-            dtype.binary: 'VARCHAR(500)',
-            dtype.categorical: 'VARCHAR(500)',
-            dtype.tags: 'VARCHAR(500)',
-            dtype.image: 'VARCHAR(500)',
-            dtype.video: 'VARCHAR(500)',
-            dtype.audio: 'VARCHAR(500)',
-            dtype.short_text: 'VARCHAR(500)',
-            dtype.rich_text: 'VARCHAR(500)',
-            dtype.quantity: 'VARCHAR(500)',
-            dtype.num_array: 'VARCHAR(500)',
-            dtype.cat_array: 'VARCHAR(500)',
-            dtype.num_tsarray: 'VARCHAR(500)',
-            dtype.cat_tsarray: 'VARCHAR(500)',
-            'default': 'VARCHAR(500)'
-        }
-
         column_declaration = []
         for name in columns:
-            try:
-                col_subtype = dtype_dict[name]
-                new_type = subtype_map.get(col_subtype, subtype_map.get('default'))
-                column_declaration.append(f' `{name}` {new_type} ')
-                if name in predicted_cols:
-                    column_declaration.append(f' `{name}_original` {new_type} ')
-            except Exception as e:
-                log.error(f'Error: can not determine mysql data type for column {name}: {e}')
+            new_type = _SUBTYPE_MAP.get(dtype_dict.get(name), _DEFAULT_TYPE)
+            column_declaration.append(f' `{name}` {new_type} ')
+            if name in predicted_cols:
+                column_declaration.append(f' `{name}_original` {new_type} ')
 
         return column_declaration
 
     def _escape_table_name(self, name):
         return '`' + name.replace('`', '``') + '`'
 
+    def _get_pooled_connection(self):
+        config = self._get_connection_config()
+        if self.integration_id is None:
+            # integration is not stored, there is nothing to share the pool with
+            return mysql.connector.connect(**config)
+        config_key = tuple(sorted((key, str(value)) for key, value in config.items()))
+        with _connection_pools_lock:
+            pool_record = _connection_pools.get(self.integration_id)
+        if pool_record is None or pool_record[0] != config_key:
+            # pool opens connections on creation, so it is created out of the lock:
+            # unreachable host should not block other integrations
+            pool = _ConnectionPool(
+                pool_name=f'mindsdb_{next(_pool_ids)}',
+                pool_size=4,
+                **config
+            )
+            unused_pool = None
+            with _connection_pools_lock:
+                old_record = _connection_pools.get(self.integration_id)
+                if old_record is None or old_record[0] != config_key:
+                    # integration is new or its config was changed
+                    pool_record = (config_key, pool)
+                    _connection_pools[self.integration_id] = pool_record
+                    if old_record is not None:
+                        unused_pool = old_record[1]
+                else:
+                    # pool was created by another thread
+                    pool_record = old_record
+                    unused_pool = pool
+            if unused_pool is not None:
+                unused_pool.close()
+        pool = pool_record[1]
+        try:
+            return pool.get_connection()
+        except mysql.connector.errors.PoolError:
+            # all pooled connections are busy
+            return mysql.connector.connect(**config)
+
     def _query(self, query):
-        con = self._get_connnection()
+        con = self._get_pooled_connection()
         with closing(con) as con:
-            cur = con.cursor(dictionary=True, buffered=True)
+            # unbuffered: rows are read once by fetchall instead of being buffered first
+            cur = con.cursor(dictionary=True)
             cur.execute(query)
             res = True
-            try:
+            if cur.with_rows:
                 res = cur.fetchall()
-            except Exception:
-                pass
             con.commit()
 
         return res
 
+    def _query_many(self, queries):
+        con = self._get_pooled_connection()
+        with closing(con) as con:
+            cur = con.cursor()
+            for query in queries:
+                cur.execute(query)
+            con.commit()
+
+    def _get_mindsdb_tables(self):
+        result = self._query(f'SHOW TABLES FROM {self.mindsdb_database};')
+        # compare in lower case: table names are case insensitive if lower_case_table_names is set
+        return set(list(row.values())[0].lower() for row in result)
+
     def _get_connect_string(self, table):
         user = f"{self.config['api']['mysql']['user']}_{self.name}"
         password = self.config['api']['mysql']['password']
@@ -123,13 +211,16 @@ class MySQL(Integration, MySQLConnectionChecker):
         return connect
 
     def setup(self):
-        self._query(f'DROP DATABASE IF EXISTS {self.mindsdb_database}')
-        self._query(f'CREATE DATABASE IF NOT EXISTS {self.mindsdb_database}')
+        predictors_connect = self._get_connect_string('predictors')
+        commands_connect = self._get_connect_string('commands')
 
-        connect = self._get_connect_string('predictors')
+        queries = [f'CREATE DATABASE IF NOT EXISTS {self.mindsdb_database}']
 
-        q = f"""
-            CREATE TABLE IF NOT EXISTS {self.mindsdb_database}.predictors (
+        # system tables are recreated, so they always use the current connection string,
+        # predictors tables are kept: they are recreated by register_predictors
+        queries.append(f'DROP TABLE IF EXISTS {self.mindsdb_database}.predictors')
+        queries.append(f"""
+            CREATE TABLE {self.mindsdb_database}.predictors (
                 name VARCHAR(500),
                 status VARCHAR(500),
                 accuracy VARCHAR(500),
@@ -140,57 +231,93 @@ class MySQL(Integration, MySQLConnectionChecker):
                 select_data_query VARCHAR(500),
                 training_options VARCHAR(500),
                 key name_key (name)
-            ) ENGINE=FEDERATED CHARSET=utf8 CONNECTION='{connect}';
-        """
-        self._query(q)
-
-        connect = self._get_connect_string('commands')
+            ) ENGINE=FEDERATED CHARSET=utf8 CONNECTION='{predictors_connect}';
+        """)
 
-        q = f"""
-            CREATE TABLE IF NOT EXISTS {self.mindsdb_database}.commands (
+        queries.append(f'DROP TABLE IF EXISTS {self.mindsdb_database}.commands')
+        queries.append(f"""
+            CREATE TABLE {self.mindsdb_database}.commands (
                 command VARCHAR(500),
                 key command_key (command)
-            ) ENGINE=FEDERATED CHARSET=utf8 CONNECTION='{connect}';
-        """
-        self._query(q)
+            ) ENGINE=FEDERATED CHARSET=utf8 CONNECTION='{commands_connect}';
+        """)
+
+        self._query_many(queries)
+
+        self._drop_unknown_predictors_tables()
+
+    def _get_predictors_names(self):
+        integration_record = db.session.query(db.Integration).get(self.integration_id)
+        if integration_record is None:
+            return None
+        predictors = db.session.query(db.Predictor.name, db.Predictor.data).filter_by(
+            company_id=integration_record.company_id
+        )
+        return set(
+            x.name.lower() for x in predictors
+            if not (isinstance(x.data, dict) and 'error' in x.data)
+        )
+
+    def _drop_unknown_predictors_tables(self):
+        # tables of predictors which were deleted or failed while integration was offline
+        if self.integration_id is None:
+            return
+        predictors_names = self._get_predictors_names()
+        if predictors_names is None:
+            return
+        known_tables = predictors_names | {'predictors', 'commands'}
+        queries = [
+            self._drop_predictor_query(name)
+            for name in self._get_mindsdb_tables() - known_tables
+        ]
+        if len(queries) > 0:
+            self._query_many(queries)
 
     def register_predictors(self, model_data_arr):
+        existing_tables = self._get_mindsdb_tables()
+        queries = []
         for model_meta in model_data_arr:
             name = model_meta['name']
             predict = model_meta['predict']
             if not isinstance(predict, list):
                 predict = [predict]
-            columns_sql = ','.join(self._to_mysql_table(
+            columns = self._to_mysql_table(
                 model_meta['dtype_dict'],
                 predict,
                 list(model_meta['dtype_dict'].keys())
-            ))
-            columns_sql += ',`when_data` varchar(500)'
-            columns_sql += ',`select_data_query` varchar(500)'
+            )
+            columns.append('`when_data` varchar(500)')
+            columns.append('`select_data_query` varchar(500)')
             for col in predict:
-                columns_sql += f',`{col}_confidence` double'
+                columns.append(f'`{col}_confidence` double')
                 if model_meta['dtype_dict'][col] in (dtype.integer, dtype.float):
-                    columns_sql += f',`{col}_min` double'
-                    columns_sql += f',`{col}_max` double'
-                columns_sql += f',`{col}_explain` varchar(500)'
+                    columns.append(f'`{col}_min` double')
+                    columns.append(f'`{col}_max` double')
+                columns.append(f'`{col}_explain` varchar(500)')
+            columns_sql = ','.join(columns)
 
             connect = self._get_connect_string(name)
 
-            self.unregister_predictor(name)
-            q = f"""
+            if name.lower() in existing_tables:
+                queries.append(self._drop_predictor_query(name))
+            queries.append(f"""
                 CREATE TABLE {self.mindsdb_database}.{self._escape_table_name(name)} (
                     {columns_sql},
                     index when_data_index (when_data),
                     index select_data_query_index (select_data_query)
                 ) ENGINE=FEDERATED CHARSET=utf8 CONNECTION='{connect}';
-            """
-            self._query(q)
+            """)
 
-    def unregister_predictor(self, name):
-        q = f"""
+        if len(queries) > 0:
+            self._query_many(queries)
+
+    def _drop_predictor_query(self, name):
+        return f"""
             drop table if exists {self.mindsdb_database}.{self._escape_table_name(name)};
         """
-        self._query(q)
+
+    def unregister_predictor(self, name):
+        self._query(self._drop_predictor_query(name))
 
     def get_row_count(self, query):
         q = f"""
@@ -201,13 +328,15 @@ class MySQL(Integration, MySQLConnectionChecker):
         return result[0]['count']
 
     def get_columns(self, query):
-        q = f"SELECT * from ({query}) LIMIT 1;"
-        query_response = self._query(q)
-        if len(query_response) > 0:
-            columns = list(query_response[0].keys())
-            return columns
-        else:
-            return []
+        # LIMIT 0 lets the server resolve the result columns without producing any rows
+        q = f"SELECT * from ({query}) as query LIMIT 0;"
+        con = self._get_pooled_connection()
+        with closing(con) as con:
+            cur = con.cursor()
+            cur.execute(q)
+            columns = [x[0] for x in cur.description or []]
+            con.consume_results()
+        return columns
 
     def get_tables_list(self):
         q = "SHOW TABLES;"
@@ -101,6 +101,14 @@ class PostgreSQL(Integration, PostgreSQLConnectionChecker):
 
         return res
 
+    def _query_many(self, queries):
+        con = self._get_connection()
+        with closing(con) as con:
+            cur = con.cursor()
+            for query in queries:
+                cur.execute(query)
+            con.commit()
+
     def setup(self):
         user = f"{self.config['api']['mysql']['user']}_{self.name}"
         password = self.config['api']['mysql']['password']
@@ -166,6 +174,7 @@ class PostgreSQL(Integration, PostgreSQLConnectionChecker):
         self._query(q)
 
     def register_predictors(self, model_data_arr):
+        queries = []
         for model_meta in model_data_arr:
             name = model_meta['name']
             predict = model_meta['predict']
@@ -184,20 +193,25 @@ class PostgreSQL(Integration, PostgreSQLConnectionChecker):
                     columns_sql += f',"{col}_max" float8'
                 columns_sql += f',"{col}_explain" text'
 
-            self.unregister_predictor(name)
-            q = f"""
+            queries.append(self._drop_predictor_query(name))
+            queries.append(f"""
                 CREATE FOREIGN TABLE {self.mindsdb_database}.{self._escape_table_name(name)} (
                     {columns_sql}
                 ) SERVER server_{self.mindsdb_database}
                 OPTIONS (dbname 'mindsdb', table_name '{name}');
-            """
-            self._query(q)
+            """)
 
-    def unregister_predictor(self, name):
-        q = f"""
+        # postgres DDL is transactional, so all predictors are registered with one commit
+        if len(queries) > 0:
+            self._query_many(queries)
+
+    def _drop_predictor_query(self, name):
+        return f"""
             DROP FOREIGN TABLE IF EXISTS {self.mindsdb_database}.{self._escape_table_name(name)};
         """
-        self._query(q)
+
+    def unregister_predictor(self, name):
+        self._query(self._drop_predictor_query(name))
 
     def get_row_count(self, query):
         q = f"""
@@ -1,11 +1,5 @@
-from mindsdb.integrations.clickhouse.clickhouse import Clickhouse
-from mindsdb.integrations.postgres.postgres import PostgreSQL
-from mindsdb.integrations.mariadb.mariadb import Mariadb
-from mindsdb.integrations.mysql.mysql import MySQL
-from mindsdb.integrations.mssql.mssql import MSSQL
-from mindsdb.integrations.mongodb.mongodb import MongoDB
-from mindsdb.integrations.redis.redisdb import Redis
-from mindsdb.integrations.kafka.kafkadb import Kafka
+import importlib
+
 from mindsdb.utilities.log import log as logger
 from mindsdb.utilities.config import Config
 from mindsdb.interfaces.database.integrations import DatasourceController
@@ -13,14 +7,16 @@ from mindsdb.utilities.with_kwargs_wrapper import WithKWArgsWrapper
 
 
 class DatabaseWrapper():
-    known_dbs = {'clickhouse': Clickhouse,
-                 'mariadb': Mariadb,
-                 'mysql': MySQL,
-                 'postgres': PostgreSQL,
-                 'mssql': MSSQL,
-                 'mongodb': MongoDB,
-                 'redis': Redis,
-                 'kafka': Kafka}
+    # integrations are imported on first use, so their database drivers
+    # are not loaded by processes which never touch them
+    known_dbs = {'clickhouse': ('mindsdb.integrations.clickhouse.clickhouse', 'Clickhouse'),
+                 'mariadb': ('mindsdb.integrations.mariadb.mariadb', 'Mariadb'),
+                 'mysql': ('mindsdb.integrations.mysql.mysql', 'MySQL'),
+                 'postgres': ('mindsdb.integrations.postgres.postgres', 'PostgreSQL'),
+                 'mssql': ('mindsdb.integrations.mssql.mssql', 'MSSQL'),
+                 'mongodb': ('mindsdb.integrations.mongodb.mongodb', 'MongoDB'),
+                 'redis': ('mindsdb.integrations.redis.redisdb', 'Redis'),
+                 'kafka': ('mindsdb.integrations.kafka.kafkadb', 'Kafka')}
 
     def __init__(self, company_id):
         self.config = Config()
@@ -45,7 +41,9 @@ class DatabaseWrapper():
         if integration:
             db_type = integration['type']
             if db_type in self.known_dbs:
-                return self.known_dbs[db_type](self.config, db_alias, integration)
+                module_name, class_name = self.known_dbs[db_type]
+                integration_class = getattr(importlib.import_module(module_name), class_name)
+                return integration_class(self.config, db_alias, integration)
             logger.warning(f'Uknown integration type: {db_type} for database called: {db_alias}')
             return False
         return True
@@ -113,9 +113,15 @@ class DatasourceController:
             FsStore().delete(folder_name)
         except Exception:
             pass
+        integration_id = integration_record.id
+        integration_type = (integration_record.data or {}).get('type')
         session.delete(integration_record)
         session.commit()
 
+        if integration_type == 'mysql':
+            from mindsdb.integrations.mysql.mysql import close_connection_pool
+            close_connection_pool(integration_id)
+
     def _get_integration_record_data(self, integration_record, sensitive_info=True):
         if integration_record is None or integration_record.data is None:
             return None
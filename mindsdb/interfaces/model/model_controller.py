@@ -9,10 +9,9 @@ from contextlib import contextmanager
 from dateutil.parser import parse as parse_datetime
 from typing import Optional, Tuple, Union, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
 from typing import List
 
-from torch import dtype
-
 import lightwood
 from lightwood.api.types import ProblemDefinition
 from lightwood import __version__ as lightwood_version
@@ -40,6 +39,7 @@ class ModelController():
     fs_store: FsStore
     predictor_cache: Dict[str, Dict[str, Union[Any]]]
     ray_based: bool
+    http_session: requests.Session
 
     def __init__(self, ray_based: bool) -> None:
         self.config = Config()
@@ -47,6 +47,12 @@ class ModelController():
         self.predictor_cache = {}
         self.ray_based = ray_based
 
+        # keep-alive connections to the custom predictors' serving endpoints
+        self.http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+        self.http_session.mount('http://', adapter)
+        self.http_session.mount('https://', adapter)
+
     def _invalidate_cached_predictors(self) -> None:
         # @TODO: Cache will become stale if the respective ModelInterface is not invoked yet a bunch of predictors remained cached, no matter where we invoke it. In practice shouldn't be a big issue though
         for predictor_name in list(self.predictor_cache.keys()):
@@ -237,7 +243,6 @@ class ModelController():
 
         predictor_record = db.session.query(db.Predictor).filter_by(company_id=company_id, name=original_name).first()
         assert predictor_record is not None
-        predictor_data = self.get_model_data(name, company_id)
 
         if isinstance(when_data, dict) and 'kwargs' in when_data and 'args' in when_data:
             ds_cls = getattr(mindsdb_datasources, when_data['class'])
@@ -248,25 +253,27 @@ class ModelController():
             df = pd.DataFrame(when_data)
 
         if predictor_record.is_custom:
+            # everything needed to call a custom predictor is in the record itself
+            predictor_data = predictor_record.data
             if predictor_data['format'] == 'mlflow':
+                # mlflow 'pandas-split' payload: column names and a list of rows
                 columns = list(df.columns)
-                data = []
-                for col in columns:
-                    data.append([x for x in df[col]])
-                
-                resp = requests.post(predictor_data['predict_url'], json={
+                if isinstance(when_data, list):
+                    data = [[row.get(col) for col in columns] for row in when_data]
+                else:
+                    data = df.to_dict(orient='split')['data']
+
+                resp = self.http_session.post(predictor_data['predict_url'], json={
                     'columns': columns,
                     'data': data
                 })
                 answer: List[object] = resp.json()
 
-                predictions = pd.DataFrame({
-                    'prediction': answer
-                })
+                predictions = [{'prediction': x} for x in answer]
             elif predictor_data['format'] == 'ray_server':
                 serialized_df = json.dumps(df.to_dict())
-                resp = requests.post(predictor_data['predict_url'], json={'df': serialized_df})
-                predictions = pd.DataFrame(resp.json())
+                resp = self.http_session.post(predictor_data['predict_url'], json={'df': serialized_df})
+                predictions = pd.DataFrame(resp.json()).to_dict(orient='records')
 
         else:
             fs_name = f'predictor_{company_id}_{predictor_record.id}'
@@ -282,6 +289,7 @@ class ModelController():
                 if psutil.virtual_memory().available < 1.2 * pow(10, 9):
                     self.predictor_cache = {}
 
+                predictor_data = self.get_model_data(name, company_id)
                 if predictor_data['status'] == 'complete':
                     self.fs_store.get(fs_name, fs_name, self.config['paths']['predictors'])
                     self.predictor_cache[name] = {
@@ -301,8 +309,8 @@ class ModelController():
             predictions = self.predictor_cache[name]['predictor'].predict(df)
             # Bellow is useful for debugging caching and storage issues
             # del self.predictor_cache[name]
+            predictions = predictions.to_dict(orient='records')
 
-        predictions = predictions.to_dict(orient='records')
         target = predictor_record.to_predict[0]
         if pred_format in ('explain', 'dict', 'dict&explain'):
             explain_arr = []
@@ -368,6 +376,9 @@ class ModelController():
 
         linked_db_ds = db.session.query(db.Datasource).filter_by(company_id=company_id, id=predictor_record.datasource_id).first()
 
+        return self._get_model_data_from_records(predictor_record, linked_db_ds)
+
+    def _get_model_data_from_records(self, predictor_record, linked_db_ds):
         data = deepcopy(predictor_record.data)
         data['dtype_dict'] = predictor_record.dtype_dict
         data['created_at'] = str(parse_datetime(str(predictor_record.created_at).split('.')[0]))
@@ -402,6 +413,10 @@ class ModelController():
                 data['accuracy'] = float(np.mean(list(data['accuracies'].values())))
         return data
 
+    def has_model(self, name: str, company_id: int) -> bool:
+        predictor_record = db.session.query(db.Predictor.id).filter_by(company_id=company_id, name=name).first()
+        return predictor_record is not None
+
     def get_model_description(self, name: str, company_id: int):
         """
         Similar to `get_model_data` but meant to be seen directly by the user, rather than parsed by something like the Studio predictor view.
@@ -423,9 +438,20 @@ class ModelController():
         return model_description
 
     def get_models(self, company_id: int):
+        # load all predictors and their datasources with two queries, instead of two queries per predictor
+        predictor_records = db.session.query(db.Predictor).filter_by(company_id=company_id).all()
+        datasource_ids = set(x.datasource_id for x in predictor_records if x.datasource_id is not None)
+        datasources = {}
+        if len(datasource_ids) > 0:
+            datasources = {
+                x.id: x for x in db.session.query(db.Datasource).filter_by(company_id=company_id).filter(
+                    db.Datasource.id.in_(datasource_ids)
+                )
+            }
+
         models = []
-        for db_p in db.session.query(db.Predictor).filter_by(company_id=company_id):
-            model_data = self.get_model_data(db_p.name, company_id=company_id)
+        for db_p in predictor_records:
+            model_data = self._get_model_data_from_records(db_p, datasources.get(db_p.datasource_id))
             reduced_model_data = {}
 
             for k in ['name', 'version', 'is_active', 'predict', 'status',
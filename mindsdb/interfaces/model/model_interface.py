@@ -21,6 +21,9 @@ class ModelInterface():
     def get_model_data(self, *args, **kwargs):
         return self.controller.get_model_data(*args, **kwargs)
 
+    def has_model(self, *args, **kwargs):
+        return self.controller.has_model(*args, **kwargs)
+
     def get_model_description(self, *args, **kwargs):
         return self.controller.get_model_description(*args, **kwargs)
 
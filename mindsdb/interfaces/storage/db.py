@@ -3,7 +3,7 @@ import json
 import datetime
 
 import numpy as np
-from sqlalchemy import create_engine, orm, types, UniqueConstraint
+from sqlalchemy import create_engine, event, orm, types, UniqueConstraint
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy import Column, Integer, String, DateTime, Boolean, Index
@@ -13,6 +13,15 @@ from sqlalchemy.sql.schema import ForeignKey
 
 if os.environ['MINDSDB_DB_CON'].startswith('sqlite:'):
     engine = create_engine(os.environ['MINDSDB_DB_CON'], echo=False)
+
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA cache_size=-65536')  # 64MB
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.close()
 else:
     engine = create_engine(os.environ['MINDSDB_DB_CON'], convert_unicode=True, pool_size=30, max_overflow=200, echo=False)
 Base = declarative_base()